@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import io
 import math
 import wave
@@ -8,19 +9,51 @@ from typing import Dict
 
 import pygame
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - minimal install without numpy
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
 
 SAMPLE_RATE = 22050
 
+# The scalar fallback path replaces math.sin with a degree-7 minimax
+# polynomial (range-reduced to [-pi, pi]); plenty accurate for SFX and a
+# few times faster than libm. Flip the flag to compare against math.sin.
+_USE_FAST_SIN = True
+
+_TWO_PI = 2.0 * math.pi
+_INV_TWO_PI = 1.0 / _TWO_PI
+
+
+def _fast_sin(x: float) -> float:
+    x -= _TWO_PI * math.floor(x * _INV_TWO_PI + 0.5)
+    xx = x * x
+    return x * (0.99898821 + xx * (-0.16541718 + xx * (0.00790468 + xx * -0.00014185)))
+
+
+_sin = _fast_sin if _USE_FAST_SIN else math.sin
+
 _AUDIO_ENABLED = True
 _SOUND_CACHE: Dict[str, pygame.mixer.Sound] = {}
 _MUSIC_BYTES: bytes | None = None
 
 
 def set_audio_enabled(enabled: bool) -> None:
-    """Toggle runtime audio playback and clear caches when disabled."""
+    """Toggle runtime audio playback and clear caches when disabled.
+
+    Rebinds the module-level ``play`` so that muted rapid-fire callers hit
+    a bare no-op instead of re-checking mixer state on every shot.
+    """
 
-    global _AUDIO_ENABLED
+    global _AUDIO_ENABLED, play
     _AUDIO_ENABLED = enabled
+    play = _play if enabled else _play_disabled
     if not enabled:
         _SOUND_CACHE.clear()
 
@@ -29,7 +62,24 @@ def is_audio_available() -> bool:
     return _AUDIO_ENABLED and pygame.mixer.get_init() is not None
 
 
-def play(name: str) -> None:
+def preload_all() -> None:
+    """Synthesize and cache every sound effect up front.
+
+    Synthesis on first play causes an audible hiccup mid-game; calling this
+    right after mixer init moves the cost to startup. Note that
+    ``set_audio_enabled(False)`` still clears the cache.
+    """
+
+    if not is_audio_available():
+        return
+    for name in ("shoot", "hit", "power"):
+        try:
+            _load_sound(name)
+        except pygame.error:
+            pass
+
+
+def _play(name: str) -> None:
     if not is_audio_available():
         return
     try:
@@ -39,6 +89,13 @@ def play(name: str) -> None:
         pass
 
 
+def _play_disabled(name: str) -> None:
+    return None
+
+
+play = _play
+
+
 def start_music(loop: int = -1, volume: float = 0.4) -> None:
     if not is_audio_available():
         return
@@ -52,20 +109,32 @@ def start_music(loop: int = -1, volume: float = 0.4) -> None:
 
 def _load_sound(name: str) -> pygame.mixer.Sound:
     if name not in _SOUND_CACHE:
-        _SOUND_CACHE[name] = pygame.mixer.Sound(file=io.BytesIO(_build_sound_bytes(name)))
+        _SOUND_CACHE[name] = _make_sound(_build_sound_samples(name))
     return _SOUND_CACHE[name]
 
 
-def _build_sound_bytes(name: str) -> bytes:
+def _build_sound_samples(name: str) -> np.ndarray | array:
     if name == "shoot":
-        samples = _synth_tone(880, 0.12, volume=0.45, harmonics=[1.0, 0.4])
-    elif name == "hit":
-        samples = _synth_noise(0.18, volume=0.6)
-    elif name == "power":
-        samples = _synth_chirp(440, 880, 0.38, volume=0.55)
-    else:
-        raise ValueError(f"Unknown sound asset: {name}")
-    return _to_wave_bytes(samples)
+        return _synth_tone(880, 0.12, volume=0.45, harmonics=[1.0, 0.4])
+    if name == "hit":
+        return _synth_noise(0.18, volume=0.6)
+    if name == "power":
+        return _synth_chirp(440, 880, 0.38, volume=0.55)
+    raise ValueError(f"Unknown sound asset: {name}")
+
+
+def _make_sound(samples: np.ndarray | array) -> pygame.mixer.Sound:
+    # The PCM is already in memory, so hand it to the mixer directly when
+    # its format matches; encoding to WAV just to have it parsed back is
+    # pure overhead. Fall back to the WAV path on any format mismatch.
+    mixer_init = pygame.mixer.get_init()
+    if np is not None and isinstance(samples, np.ndarray) and mixer_init is not None:
+        frequency, fmt, channels = mixer_init
+        if frequency == SAMPLE_RATE and fmt == -16:
+            if channels > 1:
+                samples = np.repeat(samples[:, None], channels, axis=1)
+            return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+    return pygame.mixer.Sound(file=io.BytesIO(_to_wave_bytes(samples)))
 
 
 def _get_music_bytes() -> bytes:
@@ -75,7 +144,7 @@ def _get_music_bytes() -> bytes:
     return _MUSIC_BYTES
 
 
-def _to_wave_bytes(samples: array) -> bytes:
+def _to_wave_bytes(samples: array | np.ndarray) -> bytes:
     buffer = io.BytesIO()
     with wave.open(buffer, "wb") as wav_file:
         wav_file.setnchannels(1)
@@ -85,24 +154,109 @@ def _to_wave_bytes(samples: array) -> bytes:
     return buffer.getvalue()
 
 
+# Optional numba tier: a jitted single-pass loop over a preallocated int16
+# buffer fuses synthesis, envelope and quantization without the temporaries
+# of the numpy path. Numba itself depends on numpy, so this is an
+# accelerator on top of it, not a numpy-free fallback.
+if np is not None and njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _tone_kernel(out, frequency, weights, total_weight, attack, release, volume):
+        n = out.shape[0]
+        for i in range(n):
+            t = i / SAMPLE_RATE
+            sample = 0.0
+            for k in range(weights.shape[0]):
+                sample += weights[k] * math.sin(2 * math.pi * frequency * (k + 1) * t)
+            sample /= total_weight
+            if i < attack:
+                sample *= i / attack
+            elif i > n - release:
+                sample *= max(0.0, (n - i) / release)
+            value = sample * volume
+            if value > 1.0:
+                value = 1.0
+            elif value < -1.0:
+                value = -1.0
+            out[i] = int(value * 32767)
+
+    @njit(cache=True, fastmath=True)
+    def _music_kernel(out, melody_freqs, bass_freqs, beat_samples):
+        for beat_index in range(melody_freqs.shape[0]):
+            melody_freq = melody_freqs[beat_index]
+            bass_freq = bass_freqs[beat_index]
+            for i in range(beat_samples):
+                t = (beat_index * beat_samples + i) / SAMPLE_RATE
+                env = min(1.0, i / (beat_samples * 0.18))
+                env *= min(1.0, (beat_samples - i) / (beat_samples * 0.28))
+                combined = 0.42 * math.sin(2 * math.pi * melody_freq * t) * env
+                combined += 0.28 * math.sin(2 * math.pi * bass_freq * t) * (0.55 + 0.35 * env)
+                if combined > 1.0:
+                    combined = 1.0
+                elif combined < -1.0:
+                    combined = -1.0
+                out[beat_index * beat_samples + i] = int(combined * 32767)
+
+else:
+    _tone_kernel = None
+    _music_kernel = None
+
+
 def _synth_tone(
     frequency: float,
     duration: float,
     *,
     volume: float,
     harmonics: list[float] | None = None,
-) -> array:
+) -> np.ndarray | array:
     harmonics = harmonics or [1.0]
     total_weight = max(1e-6, sum(abs(h) for h in harmonics))
     sample_count = max(1, int(SAMPLE_RATE * duration))
     attack = max(1, int(sample_count * 0.08))
     release = max(1, int(sample_count * 0.2))
+    if np is None:
+        return _synth_tone_scalar(
+            frequency, sample_count, attack, release, volume, harmonics, total_weight
+        )
+    if _tone_kernel is not None:
+        out = np.empty(sample_count, dtype=np.int16)
+        _tone_kernel(
+            out,
+            float(frequency),
+            np.asarray(harmonics, dtype=np.float64),
+            total_weight,
+            attack,
+            release,
+            volume,
+        )
+        return out
+    t = np.arange(sample_count, dtype=np.float32) / SAMPLE_RATE
+    sample = sum(
+        weight * np.sin(2 * np.pi * frequency * (idx + 1) * t)
+        for idx, weight in enumerate(harmonics)
+    ) / total_weight
+    index = np.arange(sample_count, dtype=np.float32)
+    envelope = np.minimum(index / attack, 1.0) * np.minimum((sample_count - index) / release, 1.0)
+    sample *= np.clip(envelope, 0.0, 1.0)
+    data = np.clip(sample * volume, -1.0, 1.0) * 32767
+    return data.astype(np.int16)
+
+
+def _synth_tone_scalar(
+    frequency: float,
+    sample_count: int,
+    attack: int,
+    release: int,
+    volume: float,
+    harmonics: list[float],
+    total_weight: float,
+) -> array:
     data = array("h")
     for i in range(sample_count):
         t = i / SAMPLE_RATE
         sample = 0.0
         for idx, weight in enumerate(harmonics):
-            sample += weight * math.sin(2 * math.pi * frequency * (idx + 1) * t)
+            sample += weight * _sin(2 * math.pi * frequency * (idx + 1) * t)
         sample = sample / total_weight
         if i < attack:
             sample *= i / attack
@@ -112,8 +266,18 @@ def _synth_tone(
     return data
 
 
-def _synth_noise(duration: float, *, volume: float) -> array:
+def _synth_noise(duration: float, *, volume: float) -> np.ndarray | array:
     sample_count = max(1, int(SAMPLE_RATE * duration))
+    if np is None:
+        return _synth_noise_scalar(sample_count, volume)
+    rng = np.random.default_rng(0x2C3D)
+    raw = rng.random(sample_count, dtype=np.float32) * 2.0 - 1.0
+    envelope = np.clip(1.0 - np.arange(sample_count, dtype=np.float32) / sample_count, 0.0, None)
+    data = np.clip(raw * envelope * volume, -1.0, 1.0) * 32767
+    return data.astype(np.int16)
+
+
+def _synth_noise_scalar(sample_count: int, volume: float) -> array:
     decay = 1.0 / sample_count
     data = array("h")
     seed = 0x2C3D
@@ -132,29 +296,55 @@ def _synth_chirp(
     duration: float,
     *,
     volume: float,
-) -> array:
+) -> np.ndarray | array:
     sample_count = max(1, int(SAMPLE_RATE * duration))
+    if np is None:
+        return _synth_chirp_scalar(start_freq, end_freq, sample_count, volume)
+    progress = np.arange(sample_count, dtype=np.float32) / sample_count
+    frequency = start_freq + (end_freq - start_freq) * progress
+    # Integrate the instantaneous frequency instead of multiplying by t,
+    # so the sweep is phase-continuous.
+    phase = 2 * np.pi * np.cumsum(frequency) / SAMPLE_RATE
+    wave_values = np.sin(phase)
+    envelope = np.minimum(progress / 0.15, 1.0) * np.clip((1.0 - progress) / 0.2, 0.0, None)
+    data = np.clip(wave_values * envelope * volume, -1.0, 1.0) * 32767
+    return data.astype(np.int16)
+
+
+def _synth_chirp_scalar(
+    start_freq: float,
+    end_freq: float,
+    sample_count: int,
+    volume: float,
+) -> array:
     data = array("h")
+    phase = 0.0
     for i in range(sample_count):
         progress = i / sample_count
         frequency = start_freq + (end_freq - start_freq) * progress
-        t = i / SAMPLE_RATE
-        sample = math.sin(2 * math.pi * frequency * t)
+        phase += 2 * math.pi * frequency / SAMPLE_RATE
+        sample = _sin(phase)
         envelope = min(1.0, progress / 0.15) * max(0.0, (1.0 - progress) / 0.2)
         sample *= envelope * volume
         data.append(int(max(-1.0, min(1.0, sample)) * 32767))
     return data
 
 
+_SEMITONES = {
+    note: index
+    for index, note in enumerate(
+        ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+    )
+}
+
+
+@functools.lru_cache(maxsize=None)
 def _note_frequency(name: str) -> float:
-    notes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    base_note = name[:-1]
-    octave = int(name[-1])
-    semitone = notes.index(base_note)
-    return 440.0 * 2 ** ((octave - 4) + (semitone - notes.index("A")) / 12)
+    # A4 = 440 Hz; "A" sits at semitone 9.
+    return 440.0 * 2 ** ((int(name[-1]) - 4) + (_SEMITONES[name[:-1]] - 9) / 12)
 
 
-def _synth_music_loop() -> array:
+def _synth_music_loop() -> np.ndarray | array:
     bpm = 108
     beat_duration = 60.0 / bpm
     melody = [
@@ -194,19 +384,47 @@ def _synth_music_loop() -> array:
         "F3",
     ]
     beat_samples = max(1, int(SAMPLE_RATE * beat_duration))
-    total_samples = beat_samples * len(melody)
+    if np is None:
+        return _synth_music_loop_scalar(melody, bass, beat_samples)
+    melody_freqs = np.array([_note_frequency(note) for note in melody], dtype=np.float32)
+    bass_freqs = np.array([_note_frequency(note) for note in bass], dtype=np.float32)
+    if _music_kernel is not None:
+        out = np.empty(beat_samples * len(melody), dtype=np.int16)
+        _music_kernel(
+            out,
+            melody_freqs.astype(np.float64),
+            bass_freqs.astype(np.float64),
+            beat_samples,
+        )
+        return out
+    index = np.arange(beat_samples, dtype=np.float32)
+    env = np.clip(index / (beat_samples * 0.18), 0.0, 1.0)
+    env *= np.clip((beat_samples - index) / (beat_samples * 0.28), 0.0, 1.0)
+    bass_env = 0.55 + 0.35 * env
+    beats = []
+    for beat_index in range(len(melody)):
+        t = (beat_index * beat_samples + index) / SAMPLE_RATE
+        melody_sample = np.sin(2 * np.pi * melody_freqs[beat_index] * t) * env
+        bass_sample = np.sin(2 * np.pi * bass_freqs[beat_index] * t) * bass_env
+        beats.append(0.42 * melody_sample + 0.28 * bass_sample)
+    data = np.clip(np.concatenate(beats), -1.0, 1.0) * 32767
+    return data.astype(np.int16)
+
+
+def _synth_music_loop_scalar(melody: list[str], bass: list[str], beat_samples: int) -> array:
+    melody_freqs = [_note_frequency(note) for note in melody]
+    bass_freqs = [_note_frequency(note) for note in bass]
     data = array("h")
-    for beat_index, note in enumerate(melody):
-        bass_note = bass[beat_index]
+    for beat_index in range(len(melody)):
+        melody_freq = melody_freqs[beat_index]
+        bass_freq = bass_freqs[beat_index]
         for i in range(beat_samples):
-            sample_index = beat_index * beat_samples + i
-            t = sample_index / SAMPLE_RATE
+            t = (beat_index * beat_samples + i) / SAMPLE_RATE
             env_attack = min(1.0, i / (beat_samples * 0.18))
             env_release = min(1.0, (beat_samples - i) / (beat_samples * 0.28))
             env = env_attack * env_release
-            melody_sample = math.sin(2 * math.pi * _note_frequency(note) * t) * env
-            bass_env = 0.55 + 0.35 * env
-            bass_sample = math.sin(2 * math.pi * _note_frequency(bass_note) * t) * bass_env
+            melody_sample = _sin(2 * math.pi * melody_freq * t) * env
+            bass_sample = _sin(2 * math.pi * bass_freq * t) * (0.55 + 0.35 * env)
             combined = 0.42 * melody_sample + 0.28 * bass_sample
             data.append(int(max(-1.0, min(1.0, combined)) * 32767))
     return data
@@ -4,11 +4,33 @@ import random
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
 import pygame
 
 from . import audio, settings
 
 
+BULLET_RADIUS = 6
+PARTICLES_PER_BURST = 12
+
+# Particle sprites keyed by (rgb, radius); circle rasterization per particle
+# per frame costs more than blitting a tiny cached surface. The key space is
+# bounded: the palette plus enemy/weapon colors at radii 1..6.
+_PARTICLE_SPRITES: dict = {}
+
+
+def _particle_sprite(color: tuple, radius: int) -> pygame.Surface:
+    key = (color, radius)
+    sprite = _PARTICLE_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        _PARTICLE_SPRITES[key] = sprite
+    return sprite
+
+
 def create_weapon(name: str) -> "Weapon":
     info = settings.WEAPON_DEFS[name]
     return Weapon(
@@ -23,47 +45,6 @@ def create_weapon(name: str) -> "Weapon":
     )
 
 
-@dataclass
-class Particle:
-    position: pygame.math.Vector2
-    velocity: pygame.math.Vector2
-    color: pygame.Color
-    lifetime: float
-    radius: float
-
-    def update(self, dt: float) -> None:
-        self.position += self.velocity * dt
-        self.lifetime -= dt
-        self.radius = max(0, self.radius - 40 * dt)
-
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.lifetime <= 0 or self.radius <= 0:
-            return
-        pygame.draw.circle(surface, self.color, self.position, int(self.radius))
-
-
-@dataclass
-class Bullet:
-    position: pygame.math.Vector2
-    velocity: pygame.math.Vector2
-    color: pygame.Color
-    damage: float
-    radius: float = 6
-    pierce: int = 0
-    alive: bool = True
-
-    def update(self, dt: float, bounds: pygame.Rect) -> None:
-        if not self.alive:
-            return
-        self.position += self.velocity * dt
-        if not bounds.collidepoint(self.position.x, self.position.y):
-            self.alive = False
-
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.alive:
-            pygame.draw.circle(surface, self.color, self.position, int(self.radius))
-
-
 @dataclass
 class Enemy:
     position: pygame.math.Vector2
@@ -75,16 +56,15 @@ class Enemy:
     size: int
     name: str
 
-    def update(self, dt: float, player_pos: pygame.math.Vector2) -> None:
-        direction = (player_pos - self.position)
-        if direction.length_squared() > 0:
-            direction = direction.normalize()
-        self.velocity = direction * self.speed
-        self.position += self.velocity * dt
+    def __post_init__(self) -> None:
+        # One reusable Rect; re-centered when the world moves the enemy
+        # rather than allocated on every property access.
+        self._rect = pygame.Rect(0, 0, self.size, self.size)
+        self._rect.center = (int(self.position.x), int(self.position.y))
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.position.x - self.size / 2), int(self.position.y - self.size / 2), self.size, self.size)
+        return self._rect
 
     def take_damage(self, amount: float) -> None:
         self.health -= amount
@@ -113,29 +93,35 @@ class Weapon:
     pierce: int = 0
     timer: float = 0.0
 
-    def try_fire(self, position: pygame.math.Vector2, target: pygame.math.Vector2) -> List[Bullet]:
+    def __post_init__(self) -> None:
+        # The spread pattern is fixed per weapon, so bake it once as unit
+        # offsets in the weapon-local frame (x = aim axis, y = perpendicular).
+        if self.projectiles > 1:
+            step = self.spread / (self.projectiles - 1)
+            angles = [-self.spread / 2 + i * step for i in range(self.projectiles)]
+        else:
+            angles = [0.0]
+        radians = np.radians(np.array(angles, dtype=np.float32))
+        self._spread_offsets = np.stack([np.cos(radians), np.sin(radians)], axis=1)
+
+    def try_fire(
+        self, position: pygame.math.Vector2, target: pygame.math.Vector2
+    ) -> Optional[np.ndarray]:
+        """Return per-projectile velocities (N, 2), or None while cooling down."""
+
         if self.timer > 0:
-            return []
+            return None
         direction = (target - position)
         if direction.length_squared() == 0:
             direction = pygame.math.Vector2(1, 0)
-        base_angle = direction.angle_to(pygame.math.Vector2(1, 0))
-        bullets = []
-        spread_step = self.spread / max(1, self.projectiles - 1) if self.projectiles > 1 else 0
-        start_angle = base_angle - self.spread / 2
-        for i in range(self.projectiles):
-            angle = start_angle + i * spread_step
-            vector = pygame.math.Vector2(1, 0).rotate(-angle)
-            bullet = Bullet(
-                position=pygame.math.Vector2(position),
-                velocity=vector * self.bullet_speed,
-                color=self.color,
-                damage=self.bullet_damage,
-                pierce=self.pierce,
-            )
-            bullets.append(bullet)
+        aim = np.array((direction.x, direction.y), dtype=np.float32)
+        aim /= np.linalg.norm(aim)
+        perp = np.array((-aim[1], aim[0]), dtype=np.float32)
+        velocities = (
+            self._spread_offsets[:, :1] * aim + self._spread_offsets[:, 1:] * perp
+        ) * self.bullet_speed
         self.timer = self.cooldown
-        return bullets
+        return velocities
 
     def update(self, dt: float) -> None:
         self.timer = max(0.0, self.timer - dt)
@@ -165,9 +151,33 @@ class Player:
             velocity = velocity.normalize()
         self.position += velocity * self.speed * dt
 
+    def __post_init__(self) -> None:
+        self._limits = None
+        self._limits_key = None
+
     def keep_in_bounds(self, bounds: pygame.Rect) -> None:
-        self.position.x = max(bounds.left + self.radius, min(bounds.right - self.radius, self.position.x))
-        self.position.y = max(bounds.top + self.radius, min(bounds.bottom - self.radius, self.position.y))
+        # Hot input path: cache the clamp limits (bounds are fixed for the
+        # life of a world) and clamp with compare chains instead of nested
+        # max/min calls.
+        key = (bounds.left, bounds.top, bounds.right, bounds.bottom, self.radius)
+        if key != self._limits_key:
+            self._limits = (
+                bounds.left + self.radius,
+                bounds.right - self.radius,
+                bounds.top + self.radius,
+                bounds.bottom - self.radius,
+            )
+            self._limits_key = key
+        xmin, xmax, ymin, ymax = self._limits
+        position = self.position
+        if position.x < xmin:
+            position.x = xmin
+        elif position.x > xmax:
+            position.x = xmax
+        if position.y < ymin:
+            position.y = ymin
+        elif position.y > ymax:
+            position.y = ymax
 
     def draw(self, surface: pygame.Surface) -> None:
         pygame.draw.circle(surface, self.color, self.position, self.radius)
@@ -185,16 +195,41 @@ class GameWorld:
             speed=settings.PLAYER_SPEED,
         )
         self.enemies: List[Enemy] = []
-        self.bullets: List[Bullet] = []
-        self.particles: List[Particle] = []
+        # Bullets and particles live as structure-of-arrays blocks: with
+        # hundreds of short-lived projectiles per frame, per-entity Python
+        # objects spend more time on attribute access than on the math.
+        self.bullet_pos = np.empty((0, 2), dtype=np.float32)
+        self.bullet_vel = np.empty((0, 2), dtype=np.float32)
+        self.bullet_damage = np.empty(0, dtype=np.float32)
+        self.bullet_pierce = np.empty(0, dtype=np.int32)
+        self.bullet_alive = np.empty(0, dtype=bool)
+        self.bullet_color = np.empty((0, 3), dtype=np.uint8)
+        self.particle_pos = np.empty((0, 2), dtype=np.float32)
+        self.particle_vel = np.empty((0, 2), dtype=np.float32)
+        self.particle_lifetime = np.empty(0, dtype=np.float32)
+        self.particle_radius = np.empty(0, dtype=np.float32)
+        self.particle_color = np.empty((0, 3), dtype=np.uint8)
         self.elapsed = 0.0
         self.spawn_timer = 0.0
         self.spawn_interval = 1.4
         self.score = 0
         self.weapon_name: Optional[str] = None
+        self._background = self._build_background()
         if weapon_name:
             self.set_weapon_by_name(weapon_name)
 
+    def _build_background(self) -> pygame.Surface:
+        background = pygame.Surface((self.bounds.width, self.bounds.height))
+        background.fill(settings.BACKGROUND_COLOR)
+        spacing = 48
+        for x in range(0, self.bounds.width, spacing):
+            pygame.draw.line(background, settings.GRID_COLOR, (x, 0), (x, self.bounds.height))
+        for y in range(0, self.bounds.height, spacing):
+            pygame.draw.line(background, settings.GRID_COLOR, (0, y), (self.bounds.width, y))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        return background
+
     def set_weapon(self, weapon: Weapon) -> None:
         self.weapon_name = weapon.name
         self.player.weapon = weapon
@@ -213,24 +248,16 @@ class GameWorld:
         mouse_pos = pygame.math.Vector2(pygame.mouse.get_pos())
         mouse_pressed = pygame.mouse.get_pressed()[0]
         if mouse_pressed and self.player.weapon and self.player.health > 0:
-            new_bullets = self.player.weapon.try_fire(self.player.position, mouse_pos)
-            if new_bullets:
-                self.bullets.extend(new_bullets)
+            velocities = self.player.weapon.try_fire(self.player.position, mouse_pos)
+            if velocities is not None:
+                self._append_fired(self.player.position, velocities, self.player.weapon)
                 audio.play("shoot")
 
-        for bullet in self.bullets:
-            bullet.update(dt, self.bounds)
-
-        self.bullets = [b for b in self.bullets if b.alive]
-
-        for enemy in self.enemies:
-            enemy.update(dt, self.player.position)
-
+        self._update_bullets(dt)
+        self._update_enemies(dt)
         self.handle_collisions()
 
-        for particle in self.particles:
-            particle.update(dt)
-        self.particles = [p for p in self.particles if p.lifetime > 0 and p.radius > 0]
+        self._update_particles(dt)
 
         player_alive = self.player.health > 0
 
@@ -242,35 +269,139 @@ class GameWorld:
             self.spawn_enemy_wave()
             self.spawn_timer = max(0.4, self.spawn_interval - self.elapsed * 0.01)
 
+    def _append_fired(
+        self, origin: pygame.math.Vector2, velocities: np.ndarray, weapon: Weapon
+    ) -> None:
+        count = len(velocities)
+        pos = np.full((count, 2), (origin.x, origin.y), dtype=np.float32)
+        color = np.full(
+            (count, 3), (weapon.color.r, weapon.color.g, weapon.color.b), dtype=np.uint8
+        )
+        self.bullet_pos = np.concatenate([self.bullet_pos, pos])
+        self.bullet_vel = np.concatenate([self.bullet_vel, velocities])
+        self.bullet_damage = np.concatenate(
+            [self.bullet_damage, np.full(count, weapon.bullet_damage, dtype=np.float32)]
+        )
+        self.bullet_pierce = np.concatenate(
+            [self.bullet_pierce, np.full(count, weapon.pierce, dtype=np.int32)]
+        )
+        self.bullet_alive = np.concatenate([self.bullet_alive, np.ones(count, dtype=bool)])
+        self.bullet_color = np.concatenate([self.bullet_color, color])
+
+    def _update_bullets(self, dt: float) -> None:
+        if not len(self.bullet_pos):
+            return
+        self.bullet_pos += self.bullet_vel * dt
+        x = self.bullet_pos[:, 0]
+        y = self.bullet_pos[:, 1]
+        self.bullet_alive &= (
+            (x >= self.bounds.left)
+            & (x < self.bounds.right)
+            & (y >= self.bounds.top)
+            & (y < self.bounds.bottom)
+        )
+        if not self.bullet_alive.all():
+            self._compact_bullets()
+
+    def _compact_bullets(self) -> None:
+        keep = self.bullet_alive
+        self.bullet_pos = self.bullet_pos[keep]
+        self.bullet_vel = self.bullet_vel[keep]
+        self.bullet_damage = self.bullet_damage[keep]
+        self.bullet_pierce = self.bullet_pierce[keep]
+        self.bullet_color = self.bullet_color[keep]
+        self.bullet_alive = self.bullet_alive[keep]
+
+    def _update_enemies(self, dt: float) -> None:
+        if not self.enemies:
+            return
+        pos = np.array([(e.position.x, e.position.y) for e in self.enemies], dtype=np.float32)
+        speed = np.array([e.speed for e in self.enemies], dtype=np.float32)
+        target = np.array((self.player.position.x, self.player.position.y), dtype=np.float32)
+        direction = target - pos
+        norm = np.linalg.norm(direction, axis=1, keepdims=True)
+        direction /= np.maximum(norm, 1e-6)
+        vel = direction * speed[:, None]
+        pos += vel * dt
+        for enemy, p, v in zip(self.enemies, pos, vel):
+            enemy.position.update(float(p[0]), float(p[1]))
+            enemy.velocity.update(float(v[0]), float(v[1]))
+            enemy._rect.center = (int(p[0]), int(p[1]))
+
+    def _update_particles(self, dt: float) -> None:
+        if not len(self.particle_pos):
+            return
+        self.particle_pos += self.particle_vel * dt
+        self.particle_lifetime -= dt
+        self.particle_radius = np.maximum(0.0, self.particle_radius - 40 * dt)
+        keep = (self.particle_lifetime > 0) & (self.particle_radius > 0)
+        if not keep.all():
+            self.particle_pos = self.particle_pos[keep]
+            self.particle_vel = self.particle_vel[keep]
+            self.particle_lifetime = self.particle_lifetime[keep]
+            self.particle_radius = self.particle_radius[keep]
+            self.particle_color = self.particle_color[keep]
+
     def handle_collisions(self) -> None:
-        player_rect = pygame.Rect(0, 0, self.player.radius * 2, self.player.radius * 2)
-        player_rect.center = self.player.position
-        for enemy in list(self.enemies):
-            if enemy.rect.colliderect(player_rect):
+        # Inline AABB overlap against the player's extents: a plain compare
+        # chain beats Rect construction plus colliderect dispatch per enemy.
+        px0 = self.player.position.x - self.player.radius
+        px1 = self.player.position.x + self.player.radius
+        py0 = self.player.position.y - self.player.radius
+        py1 = self.player.position.y + self.player.radius
+        dead: set = set()
+        for index, enemy in enumerate(self.enemies):
+            half = enemy.size / 2
+            ex = enemy.position.x
+            ey = enemy.position.y
+            if ex - half <= px1 and ex + half >= px0 and ey - half <= py1 and ey + half >= py0:
                 self.player.health -= 10
                 self.spawn_particles(enemy.position, enemy.color)
                 audio.play("hit")
                 enemy.take_damage(enemy.health)
-                if enemy.is_dead() and enemy in self.enemies:
-                    self.enemies.remove(enemy)
-            for bullet in list(self.bullets):
-                if bullet.alive and enemy.rect.collidepoint(bullet.position):
-                    enemy.take_damage(bullet.damage)
-                    self.spawn_particles(bullet.position, bullet.color)
-                    audio.play("hit")
-                    if enemy.is_dead():
-                        self.score += 5
-                        self.spawn_particles(enemy.position, enemy.color)
-                        self.enemies.remove(enemy)
-                    if bullet.pierce > 0:
-                        bullet.pierce -= 1
-                    else:
-                        bullet.alive = False
-                    break
+                if enemy.is_dead():
+                    dead.add(index)
+
+        self._handle_bullet_hits(dead)
+
+        # One rebuild pass instead of list.remove per kill; remove is an
+        # O(N) scan and turns heavy combat frames quadratic.
+        if dead:
+            self.enemies = [e for i, e in enumerate(self.enemies) if i not in dead]
 
         if self.player.health <= 0:
             self.player.health = 0
 
+    def _handle_bullet_hits(self, dead: set) -> None:
+        if not self.enemies or not len(self.bullet_pos):
+            return
+        enemy_pos = np.array([(e.position.x, e.position.y) for e in self.enemies], dtype=np.float32)
+        half = np.array([e.size for e in self.enemies], dtype=np.float32) / 2
+        dx = np.abs(self.bullet_pos[None, :, 0] - enemy_pos[:, None, 0])
+        dy = np.abs(self.bullet_pos[None, :, 1] - enemy_pos[:, None, 1])
+        hit = (dx <= half[:, None]) & (dy <= half[:, None]) & self.bullet_alive[None, :]
+        hit_mask = hit.any(axis=0)
+        if not hit_mask.any():
+            return
+        # argmax picks the first overlapping enemy in list order, matching
+        # the old inner-loop "break" behavior.
+        victims = hit.argmax(axis=0)[hit_mask]
+        health = np.array([e.health for e in self.enemies], dtype=np.float32)
+        np.add.at(health, victims, -self.bullet_damage[hit_mask])
+        for enemy, new_health in zip(self.enemies, health):
+            enemy.health = float(new_health)
+        for i in np.nonzero(hit_mask)[0]:
+            self.spawn_particles(self.bullet_pos[i], self.bullet_color[i])
+            audio.play("hit")
+        expired = hit_mask & (self.bullet_pierce <= 0)
+        self.bullet_pierce[hit_mask & (self.bullet_pierce > 0)] -= 1
+        self.bullet_alive[expired] = False
+        for index, enemy in enumerate(self.enemies):
+            if index not in dead and enemy.is_dead():
+                self.score += 5
+                self.spawn_particles(enemy.position, enemy.color)
+                dead.add(index)
+
     def spawn_enemy_wave(self) -> None:
         spawn_count = 1 + int(self.elapsed // 12)
         for _ in range(spawn_count):
@@ -297,53 +428,77 @@ class GameWorld:
             )
             self.enemies.append(enemy)
 
-    def spawn_particles(self, position: pygame.math.Vector2, color: pygame.Color) -> None:
-        palette = list(settings.PARTICLE_COLORS) + [(color.r, color.g, color.b)]
-        for _ in range(12):
-            velocity = pygame.math.Vector2(random.uniform(-120, 120), random.uniform(-120, 120))
-            particle_color = random.choice(palette)
-            particle = Particle(
-                position=pygame.math.Vector2(position),
-                velocity=velocity,
-                color=pygame.Color(*particle_color),
-                lifetime=random.uniform(0.2, 0.6),
-                radius=random.uniform(2, 6),
-            )
-            self.particles.append(particle)
+    def spawn_particles(self, position, color) -> None:
+        """Emit a burst of particles; ``position``/``color`` only need indexing."""
+
+        count = PARTICLES_PER_BURST
+        palette = list(settings.PARTICLE_COLORS) + [(int(color[0]), int(color[1]), int(color[2]))]
+        pos = np.full((count, 2), (position[0], position[1]), dtype=np.float32)
+        vel = np.random.uniform(-120, 120, (count, 2)).astype(np.float32)
+        lifetime = np.random.uniform(0.2, 0.6, count).astype(np.float32)
+        radius = np.random.uniform(2, 6, count).astype(np.float32)
+        colors = np.array([random.choice(palette) for _ in range(count)], dtype=np.uint8)
+        self.particle_pos = np.concatenate([self.particle_pos, pos])
+        self.particle_vel = np.concatenate([self.particle_vel, vel])
+        self.particle_lifetime = np.concatenate([self.particle_lifetime, lifetime])
+        self.particle_radius = np.concatenate([self.particle_radius, radius])
+        self.particle_color = np.concatenate([self.particle_color, colors])
 
     def draw(self, surface: pygame.Surface) -> None:
         self.draw_grid(surface)
-        for particle in self.particles:
-            particle.draw(surface)
+        self._draw_particles(surface)
         for enemy in self.enemies:
             enemy.draw(surface)
-        for bullet in self.bullets:
-            bullet.draw(surface)
+        self._draw_bullets(surface)
         self.player.draw(surface)
 
+    def _draw_particles(self, surface: pygame.Surface) -> None:
+        if not len(self.particle_pos):
+            return
+        blit_sequence = []
+        for i in range(len(self.particle_pos)):
+            radius = int(self.particle_radius[i])
+            if radius <= 0:
+                continue
+            color = self.particle_color[i]
+            sprite = _particle_sprite((int(color[0]), int(color[1]), int(color[2])), radius)
+            blit_sequence.append(
+                (
+                    sprite,
+                    (
+                        float(self.particle_pos[i, 0]) - radius,
+                        float(self.particle_pos[i, 1]) - radius,
+                    ),
+                )
+            )
+        if blit_sequence:
+            surface.blits(blit_sequence, doreturn=False)
+
+    def _draw_bullets(self, surface: pygame.Surface) -> None:
+        for i in np.nonzero(self.bullet_alive)[0]:
+            color = self.bullet_color[i]
+            pygame.draw.circle(
+                surface,
+                (int(color[0]), int(color[1]), int(color[2])),
+                (float(self.bullet_pos[i, 0]), float(self.bullet_pos[i, 1])),
+                BULLET_RADIUS,
+            )
+
     def draw_grid(self, surface: pygame.Surface) -> None:
-        surface.fill(settings.BACKGROUND_COLOR)
-        spacing = 48
-        for x in range(0, settings.SCREEN_WIDTH, spacing):
-            pygame.draw.line(surface, settings.GRID_COLOR, (x, 0), (x, settings.SCREEN_HEIGHT))
-        for y in range(0, settings.SCREEN_HEIGHT, spacing):
-            pygame.draw.line(surface, settings.GRID_COLOR, (0, y), (settings.SCREEN_WIDTH, y))
+        surface.blit(self._background, (0, 0))
 
     def draw_ui(self, surface: pygame.Surface) -> None:
-        font_small = settings.get_font(20)
-        font_large = settings.get_font(32)
-        health_text = font_large.render(f"Zdrowie: {self.player.health}", True, settings.UI_COLOR)
+        health_text = settings.render_cached(32, f"Zdrowie: {self.player.health}")
         surface.blit(health_text, (20, 20))
-        score_text = font_small.render(f"Wynik: {self.score}", True, settings.UI_COLOR)
+        score_text = settings.render_cached(20, f"Wynik: {self.score}")
         surface.blit(score_text, (20, 60))
-        timer_text = font_small.render(f"Czas: {int(self.elapsed)} s", True, settings.UI_COLOR)
+        timer_text = settings.render_cached(20, f"Czas: {int(self.elapsed)} s")
         surface.blit(timer_text, (20, 84))
         if self.player.weapon:
-            weapon_text = font_small.render(f"Broń: {self.player.weapon.name}", True, settings.UI_COLOR)
+            weapon_text = settings.render_cached(20, f"Broń: {self.player.weapon.name}")
             surface.blit(weapon_text, (20, 108))
         if self.player.health <= 0:
-            go_font = settings.get_font(48)
-            go_text = go_font.render("Przegrałeś! Naciśnij R aby spróbować ponownie", True, settings.UI_COLOR)
+            go_text = settings.render_cached(48, "Przegrałeś! Naciśnij R aby spróbować ponownie")
             surface.blit(go_text, (settings.SCREEN_WIDTH / 2 - go_text.get_width() / 2, settings.SCREEN_HEIGHT / 2 - 24))
 
     def reset(self) -> None:
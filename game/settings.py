@@ -76,11 +76,37 @@ PARTICLE_COLORS = [
 ]
 
 
-pygame.init()
 FONT_CACHE = {}
 
 def get_font(size: int) -> pygame.font.Font:
+    # Importing this module must stay side-effect free; main.py owns the
+    # full pygame.init(), we only make sure the font subsystem is up.
+    if not pygame.font.get_init():
+        pygame.font.init()
     key = (FONT_NAME, size)
     if key not in FONT_CACHE:
         FONT_CACHE[key] = pygame.font.Font(FONT_NAME, size)
     return FONT_CACHE[key]
+
+
+_TEXT_CACHE = {}
+_TEXT_CACHE_LIMIT = 64
+
+
+def render_cached(size: int, text: str, color=UI_COLOR) -> pygame.Surface:
+    """Render text through a small LRU cache.
+
+    Font.render rasterizes every glyph on each call; HUD strings change at
+    most once a second, so most frames this is a dict hit.
+    """
+
+    key = (size, text, tuple(color))
+    surface = _TEXT_CACHE.get(key)
+    if surface is not None:
+        _TEXT_CACHE[key] = _TEXT_CACHE.pop(key)
+        return surface
+    if len(_TEXT_CACHE) >= _TEXT_CACHE_LIMIT:
+        _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)))
+    surface = get_font(size).render(text, True, color)
+    _TEXT_CACHE[key] = surface
+    return surface
@@ -10,37 +10,32 @@ from game.entities import GameWorld
 
 def draw_menu(screen: pygame.Surface, weapon_names: List[str], highlighted: int) -> None:
     screen.fill(settings.BACKGROUND_COLOR)
-    title_font = settings.get_font(56)
-    subtitle_font = settings.get_font(24)
-    option_font = settings.get_font(32)
-    tip_font = settings.get_font(20)
 
-    title = title_font.render("Chibi Garden Guardians", True, settings.UI_COLOR)
+    title = settings.render_cached(56, "Chibi Garden Guardians")
     screen.blit(title, (settings.SCREEN_WIDTH // 2 - title.get_width() // 2, 70))
 
-    subtitle = subtitle_font.render("Wybierz broń (1-3), aby rozpocząć obronę ogródka", True, settings.UI_COLOR)
+    subtitle = settings.render_cached(24, "Wybierz broń (1-3), aby rozpocząć obronę ogródka")
     screen.blit(subtitle, (settings.SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 150))
 
     for idx, name in enumerate(weapon_names):
         data = settings.WEAPON_DEFS[name]
-        text = option_font.render(f"{idx + 1}. {name}", True, settings.UI_COLOR)
+        text = settings.render_cached(32, f"{idx + 1}. {name}")
         y = 220 + idx * 80
         x = settings.SCREEN_WIDTH // 2 - text.get_width() // 2
         screen.blit(text, (x, y))
-        desc = tip_font.render(data["description"], True, settings.UI_COLOR)
+        desc = settings.render_cached(20, data["description"])
         screen.blit(desc, (settings.SCREEN_WIDTH // 2 - desc.get_width() // 2, y + 42))
         if idx == highlighted:
             pygame.draw.rect(screen, data["color"], pygame.Rect(x - 18, y - 10, text.get_width() + 36, 66), 3)
 
-    help_text = tip_font.render("Sterowanie: WSAD lub strzałki, mysz – celowanie i strzał, ESC – menu", True, settings.UI_COLOR)
+    help_text = settings.render_cached(20, "Sterowanie: WSAD lub strzałki, mysz – celowanie i strzał, ESC – menu")
     screen.blit(help_text, (settings.SCREEN_WIDTH // 2 - help_text.get_width() // 2, settings.SCREEN_HEIGHT - 70))
 
     pygame.display.flip()
 
 
 def draw_pause_message(screen: pygame.Surface) -> None:
-    font = settings.get_font(24)
-    text = font.render("ESC – powrót do menu | R – restart", True, settings.UI_COLOR)
+    text = settings.render_cached(24, "ESC – powrót do menu | R – restart")
     screen.blit(text, (settings.SCREEN_WIDTH - text.get_width() - 20, settings.SCREEN_HEIGHT - 40))
 
 
@@ -48,12 +43,27 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Chibi Garden Guardians prototype")
     parser.add_argument("--mute", action="store_true", help="Wyłącz dźwięk oraz muzykę")
     parser.add_argument("--fullscreen", action="store_true", help="Uruchom grę w trybie pełnoekranowym")
+    parser.add_argument(
+        "--audio-buffer",
+        type=int,
+        default=512,
+        help="Rozmiar bufora audio w próbkach (większy = mniejsze ryzyko trzasków na słabszym sprzęcie)",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
 
+    # Match the mixer to the synth output (mono 22050 Hz, 16-bit) so SDL
+    # skips resampling on every play, and keep the buffer small for low
+    # click-to-shoot latency. Must run before pygame.init().
+    pygame.mixer.pre_init(
+        frequency=audio.SAMPLE_RATE,
+        size=-16,
+        channels=1,
+        buffer=args.audio_buffer,
+    )
     pygame.init()
 
     audio_enabled = True
@@ -67,6 +77,7 @@ def main() -> None:
             print("Nie udało się zainicjalizować miksowania audio – gra zostanie uruchomiona w trybie bez dźwięku.")
 
     audio.set_audio_enabled(audio_enabled)
+    audio.preload_all()
 
     display_flags = 0
     if args.fullscreen: